@@ -6,10 +6,12 @@
 //!
 //! This library provides both a Rust API and Python bindings.
 
+#[cfg(feature = "python")]
+use pyo3::exceptions::PyTypeError;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
-use pyo3::types::PyList;
+use pyo3::types::{PyByteArray, PyBytes, PyMapping, PyMemoryView, PyString};
 #[cfg(feature = "python")]
 use tokio::runtime::Runtime;
 
@@ -471,6 +473,25 @@ pub struct TelemetryMetrics {
     pub total_objects_registered: u64,
 }
 
+#[cfg(feature = "python")]
+/// Rejects batch arguments that are iterable but are not collections of JSON objects.
+///
+/// Strings, byte buffers and mappings can all be iterated in Python, but doing so yields
+/// characters, integers or keys rather than the objects the caller meant to pass.
+fn ensure_batch_iterable(json_objects: &Bound<'_, PyAny>) -> PyResult<()> {
+    if json_objects.is_instance_of::<PyString>()
+        || json_objects.is_instance_of::<PyBytes>()
+        || json_objects.is_instance_of::<PyByteArray>()
+        || json_objects.is_instance_of::<PyMemoryView>()
+        || json_objects.cast::<PyMapping>().is_ok()
+    {
+        return Err(PyTypeError::new_err(
+            "expected an iterable of JSON objects, not a str, bytes-like object or mapping",
+        ));
+    }
+    Ok(())
+}
+
 #[cfg(feature = "python")]
 #[pyclass(name = "JsonRegister")]
 /// Python wrapper for the `Register` struct.
@@ -615,9 +636,14 @@ impl PyJsonRegister {
     }
 
     /// Registers a batch of JSON objects from Python.
-    fn register_batch_objects(&self, json_objects: &Bound<'_, PyList>) -> PyResult<Vec<i32>> {
-        let mut values = Vec::with_capacity(json_objects.len());
-        for obj in json_objects {
+    ///
+    /// Accepts any iterable (list, tuple, generator, ...), so callers do not need to
+    /// materialise a list just to pass it in.
+    fn register_batch_objects(&self, json_objects: &Bound<'_, PyAny>) -> PyResult<Vec<i32>> {
+        ensure_batch_iterable(json_objects)?;
+        let mut values = Vec::with_capacity(json_objects.len().unwrap_or(0));
+        for obj in json_objects.try_iter()? {
+            let obj = obj?;
             let value: Value = pythonize::depythonize(&obj)
                 .map_err(|e| JsonRegisterError::SerializationError(e.to_string()))?;
             values.push(value);
@@ -728,12 +754,34 @@ fn py_canonicalise(json_obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
         .map_err(|e| JsonRegisterError::SerdeError(e).into())
 }
 
+#[cfg(feature = "python")]
+#[pyfunction(name = "canonicalise_many")]
+/// Canonicalises a batch of Python objects into their JSON string representations (as bytes).
+///
+/// Accepts any iterable and returns a list that preserves the order of the input.
+/// Converting the whole batch in one call avoids paying the Python-to-Rust call
+/// overhead once per object.
+fn py_canonicalise_many(json_objects: &Bound<'_, PyAny>) -> PyResult<Vec<Vec<u8>>> {
+    ensure_batch_iterable(json_objects)?;
+    let mut results = Vec::with_capacity(json_objects.len().unwrap_or(0));
+    for obj in json_objects.try_iter()? {
+        let obj = obj?;
+        let value: Value = pythonize::depythonize(&obj)
+            .map_err(|e| JsonRegisterError::SerializationError(e.to_string()))?;
+        let canonical =
+            crate::canonicalise::canonicalise(&value).map_err(JsonRegisterError::SerdeError)?;
+        results.push(canonical.into_bytes());
+    }
+    Ok(results)
+}
+
 /// A Python module implemented in Rust.
 #[cfg(feature = "python")]
 #[pymodule]
 fn json_register(_m: &Bound<'_, PyModule>) -> PyResult<()> {
     _m.add_class::<PyJsonRegister>()?;
     _m.add_function(wrap_pyfunction!(py_canonicalise, _m)?)?;
+    _m.add_function(wrap_pyfunction!(py_canonicalise_many, _m)?)?;
     Ok(())
 }
 